@@ -43,14 +43,340 @@ def authenticate_user(email, password):
 init_db()
 
 # Load saved models
-diabetes_model = pickle.load(open('diabetes_model.sav', 'rb'))
-heart_disease_model = pickle.load(open('heart_disease_model.sav', 'rb'))
-parkinsons_model = pickle.load(open('parkinsons_model.sav', 'rb'))
+@st.cache_resource(show_spinner=False)
+def load_model(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+diabetes_model = load_model('diabetes_model.sav')
+heart_disease_model = load_model('heart_disease_model.sav')
+parkinsons_model = load_model('parkinsons_model.sav')
 
 def validate_email(email):
     email = email.strip().lower()
     return re.match(r"[^@]+@[^@]+\.[^@]+", email) and email.endswith("@gmail.com")
 
+# Diabetes Prediction Page
+@st.fragment
+def diabetes_prediction_page():
+    st.title("Diabetes Prediction using ML")
+
+    # Input fields (batched in a form so edits don't trigger a rerun)
+    with st.form("diabetes_form"):
+        patient_name = st.text_input("Patient Name")
+        Pregnancies = st.number_input("Number of Pregnancies", min_value=0)
+        Glucose = st.number_input("Glucose Level", min_value=0)
+        BloodPressure = st.number_input("Blood Pressure value", min_value=0)
+        SkinThickness = st.number_input("Skin Thickness value", min_value=0)
+        Insulin = st.number_input("Insulin Level", min_value=0)
+        BMI = st.number_input("BMI value", min_value=0.0, format="%.2f")
+        DiabetesPedigreeFunction = st.number_input("Diabetes Pedigree Function value", min_value=0.0, format="%.2f")
+        Age = st.number_input("Age of the Person", min_value=0)
+        submitted = st.form_submit_button("Diabetes Test Result")
+
+    if submitted:
+        # Model prediction
+        try:
+            diab_prediction = diabetes_model.predict(
+                [[Pregnancies, Glucose, BloodPressure, SkinThickness, Insulin, BMI, DiabetesPedigreeFunction, Age]]
+            )
+            result = "Positive" if diab_prediction[0] == 1 else "Negative"
+        except Exception as e:
+            st.error("Error during prediction. Check your model or input data.")
+            result = None
+        if result:
+            # Display test result message
+            st.markdown(f"### Test Result: {result}")
+            # Set session state for showing the report
+            st.session_state.show_report = True
+
+    if st.session_state.show_report:
+        show_report = st.button("Click here to see Test Report")
+        if show_report:
+            # Display detailed test data only after clicking the link
+            st.markdown("#### Patient Information:")
+            st.markdown(f"*Patient Name*: {patient_name}")
+            st.markdown(f"*Age*: {Age}")  # Patient Information
+
+            # Tabular Data
+            test_data = {
+                "Parameter Name": [
+                    "Pregnancies", "Glucose", "Blood Pressure", "Skin Thickness", 
+                    "Insulin", "BMI", "Diabetes Pedigree Function"
+                ],
+                "Patient Values": [
+                    Pregnancies, Glucose, BloodPressure, SkinThickness, 
+                    Insulin, BMI, DiabetesPedigreeFunction
+                ],
+                "Normal Range": [
+                    "0-10", "70-125", "120/80", "8-25", "25-250", "18.5-24.9", "< 1"
+                ],
+                "Unit": [
+                    "Number", "mg/dL", "mmHg", "mm", "mIU/L", "kg/m^2", "No units"
+                ]
+            }
+            st.table(test_data)
+
+
+# Heart Disease Prediction Page
+@st.fragment
+def heart_disease_prediction_page():
+    st.title('Heart Disease Prediction using ML')
+
+    # Input fields (batched in a form so edits don't trigger a rerun)
+    with st.form("heart_disease_form"):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            age = st.number_input('Age')
+
+        with col2:
+            sex = st.number_input('Sex')
+
+        with col3:
+            cp = st.number_input('Chest Pain types')
+
+        with col1:
+            trestbps = st.number_input('Resting Blood Pressure')
+
+        with col2:
+            chol = st.number_input('Serum Cholestoral in mg/dl')
+
+        with col3:
+            fbs = st.number_input('Fasting Blood Sugar > 120 mg/dl')
+
+        with col1:
+            restecg = st.number_input('Resting Electrocardiographic results')
+
+        with col2:
+            thalach = st.number_input('Maximum Heart Rate achieved')
+
+        with col3:
+            exang = st.number_input('Exercise Induced Angina')
+
+        with col1:
+            oldpeak = st.number_input('ST depression induced by exercise')
+
+        with col2:
+            slope = st.number_input('Slope of the peak exercise ST segment')
+
+        with col3:
+            ca = st.number_input('Major vessels colored by flourosopy')
+
+        with col1:
+            thal = st.number_input('thal: 0 = normal; 1 = fixed defect; 2 = reversable defect')
+
+        with col2:
+            patient_name = st.text_input("Patient Name")
+
+        submitted = st.form_submit_button('Heart Disease Test Result')
+
+    if submitted:
+        try:
+            # Prepare the input data
+            inputs = [age, sex, cp, trestbps, chol, fbs, restecg, thalach, exang, oldpeak, slope, ca, thal]
+    
+            # Ensure that no inputs are missing or invalid
+            if any(i is None or i == '' for i in inputs):
+                st.error("Please ensure all fields are filled.")
+            else:
+                # Perform the prediction using the heart disease model
+                heart_prediction = heart_disease_model.predict([inputs])
+        
+                # Interpret the result
+                heart_result = "Positive" if heart_prediction[0] == 1 else "Negative"
+                st.markdown(f"### Test Result: {heart_result}")
+        
+                # Show detailed information in a report
+                st.session_state.show_report = True
+        except Exception as e:
+            st.error(f"An error occurred during prediction: {e}")
+
+    # Show detailed report if button is clicked
+    if st.session_state.show_report:
+        show_report = st.button("Click here to see Test Report")
+        if show_report:
+            # Patient Information
+            st.markdown(f"#### Patient Information:")
+            st.markdown(f"**Patient Name**: {patient_name}")
+            st.markdown(f"**Age**: {age}")
+    
+            # Test Parameters and Values
+            st.markdown(f"#### Test Parameters and Values:")
+
+            # Defining parameter names, ranges, and units
+            test_data = {
+                "Parameter Name": [
+                    "Age", "Sex", "Chest Pain Type", "Resting Blood Pressure", 
+                    "Cholestoral", "Fasting Blood Sugar", "Resting Electrocardiographic", 
+                    "Max Heart Rate", "Exercise Angina", "ST Depression", 
+                    "Peak ST Slope", "Major Vessels", "Thalassemia"
+                ],
+                "Patient Values": [
+                    age, 'Female' if sex == 0 else 'Male', cp, trestbps, chol, 
+                    'Yes' if fbs == 1 else 'No', restecg, thalach, 
+                    'Yes' if exang == 1 else 'No', oldpeak, slope, ca, thal
+                ],
+                "Normal Range": [
+                    "1-120", "0 = Female, 1 = Male", "0: Typical Angina, 1: Atypical Angina, 2: Non-Anginal Pain, 3: Asymptomatic",
+                    "50-200", "100-600", "Yes: >120 mg/dl, No: <=120 mg/dl", "0: Normal, 1: ST-T wave abnormality, 2: Left ventricular hypertrophy",
+                    "60-220", "0: No, 1: Yes", "0.0-6.0", "0: Upsloping, 1: Flat, 2: Downsloping", "0-3", "0: Normal, 1: Fixed defect, 2: Reversible defect"
+                ],
+                "Unit": [
+                    "Years", "Female/Male", "Type", "mm Hg", "mg/dl", "Yes/No", "Type", 
+                    "bpm (beats per minute)", "Yes/No", "ST Depression", "Type", "Count", "Type"
+                ]
+            }
+    
+            # Display the table using st.table
+            st.table(test_data)
+
+
+# Parkinson's Prediction Page
+@st.fragment
+def parkinsons_prediction_page():
+    st.title("Parkinson's Disease Prediction using ML")
+
+    # Input fields (batched in a form so edits don't trigger a rerun)
+    with st.form("parkinsons_form"):
+        col1, col2, col3, col4, col5 = st.columns(5)
+
+        with col1:
+            patient_name = st.text_input("Patient Name")
+
+        with col2:
+            Age = st.number_input("Age of the Person", min_value=0)
+
+        with col3:
+            fo = st.text_input('MDVP:Fo(Hz)')
+
+        with col4:
+            fhi = st.text_input('MDVP:Fhi(Hz)')
+
+        with col5:
+            flo = st.text_input('MDVP:Flo(Hz)')
+
+        with col1:
+            Jitter_percent = st.text_input('MDVP:Jitter(%)')
+
+        with col2:
+            Jitter_Abs = st.text_input('MDVP:Jitter(Abs)')
+
+        with col3:
+            RAP = st.text_input('MDVP:RAP')
+
+        with col4:
+            PPQ = st.text_input('MDVP:PPQ')
+
+        with col5:
+            DDP = st.text_input('Jitter:DDP')
+
+        with col1:
+            Shimmer = st.text_input('MDVP:Shimmer')
+
+        with col2:
+            Shimmer_dB = st.text_input('MDVP:Shimmer(dB)')
+
+        with col3:
+            APQ3 = st.text_input('Shimmer:APQ3')
+
+        with col4:
+            APQ5 = st.text_input('Shimmer:APQ5')
+
+        with col5:
+            APQ = st.text_input('MDVP:APQ')
+
+        with col1:
+            DDA = st.text_input('Shimmer:DDA')
+
+        with col2:
+            NHR = st.text_input('NHR')
+
+        with col3:
+            HNR = st.text_input('HNR')
+
+        with col4:
+            RPDE = st.text_input('RPDE')
+
+        with col5:
+            DFA = st.text_input('DFA')
+
+        with col1:
+            spread1 = st.text_input('spread1')
+
+        with col2:
+            spread2 = st.text_input('spread2')
+
+        with col3:
+            D2 = st.text_input('D2')
+
+        with col4:
+            PPE = st.text_input('PPE')
+
+        submitted = st.form_submit_button("Parkinson's Test Result")
+
+    # Trigger prediction on form submission
+    if submitted:
+        # Collect input values
+        user_input = [fo, fhi, flo, Jitter_percent, Jitter_Abs, RAP, PPQ, DDP, Shimmer, Shimmer_dB, APQ3, APQ5,
+                  APQ, DDA, NHR, HNR, RPDE, DFA, spread1, spread2, D2, PPE]
+
+        try:
+            # Ensure that all user inputs are valid (not empty or None)
+            if any(i is None or i == '' for i in user_input):
+                st.error("Please ensure all fields are filled.")
+            else:
+                # Make prediction using the model
+                parkinsons_prediction = parkinsons_model.predict([user_input])
+
+                # Diagnosis result
+                parkinsons_diagnosis = "Positive" if parkinsons_prediction[0] == 1 else "Negative"
+                st.markdown(f"### Test Result: {parkinsons_diagnosis}")
+
+                # Set the session state to show the report
+                st.session_state.show_report = True
+
+        except Exception as e:
+            st.error(f"Error during prediction: {e}")
+
+    # Show detailed report if button is clicked
+    if st.session_state.show_report:
+        show_report = st.button("Click here to see Test Report")
+        if show_report:
+            # Patient Information
+            st.markdown(f"#### Patient Information:")
+            st.markdown(f"**Patient Name**: {patient_name}")
+            st.markdown(f"**Age**: {Age}")
+
+            # Test Parameters and Values
+            st.markdown(f"#### Test Parameters and Values:")
+
+            # Defining parameter names, ranges, and units
+            test_data = {
+                "Parameter Name": [
+                    "MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)", "MDVP:Jitter(%)", 
+                    "MDVP:Jitter(Abs)", "MDVP:RAP", "MDVP:PPQ", "Jitter:DDP", "MDVP:Shimmer", 
+                    "MDVP:Shimmer(dB)", "Shimmer:APQ3", "Shimmer:APQ5", "MDVP:APQ", "Shimmer:DDA", 
+                    "NHR", "HNR", "RPDE", "DFA", "spread1", "spread2", "D2", "PPE"
+                    ],
+                "Patient Values": [fo, fhi, flo, Jitter_percent, Jitter_Abs, RAP, PPQ, DDP, Shimmer, Shimmer_dB, APQ3, APQ5,
+                  APQ, DDA, NHR, HNR, RPDE, DFA, spread1, spread2, D2, PPE],
+                "Normal Range": [
+                    "50-150", "50-160", "50-150", "0-3", "0-2", "0-2", "0-2", "0-2", 
+                    "0-1", "0-0.5", "0.1-0.5", "0.1-0.5", "0-1", "0-1", "0.1-0.5", "0.1-0.5", 
+                    "0-0.5", "0-0.5", "0-1", "0-2", "0-2", "0-1"
+                    ],
+                "Unit": [
+                    "Hz", "Hz", "Hz", "%", "Abs", "No unit", "No unit", "No unit", "No unit", 
+                    "dB", "No unit", "No unit", "No unit", "No unit", "No unit", "No unit", "No unit", 
+                    "No unit", "No unit", "No unit", "No unit", "No unit"
+                ]
+            }
+
+            # Display the table using st.table
+            st.table(test_data)
+
+
 # Initialize session state variables
 if "logged_in" not in st.session_state:
     st.session_state.logged_in = False
@@ -347,305 +673,11 @@ if st.session_state.logged_in:
                 - Protecting the head from injury
                 """)
     elif selected == "Diabetes Prediction":
-        st.title("Diabetes Prediction using ML")
-
-        # Input fields
-        patient_name = st.text_input("Patient Name")
-        Pregnancies = st.number_input("Number of Pregnancies", min_value=0)
-        Glucose = st.number_input("Glucose Level", min_value=0)
-        BloodPressure = st.number_input("Blood Pressure value", min_value=0)
-        SkinThickness = st.number_input("Skin Thickness value", min_value=0)
-        Insulin = st.number_input("Insulin Level", min_value=0)
-        BMI = st.number_input("BMI value", min_value=0.0, format="%.2f")
-        DiabetesPedigreeFunction = st.number_input("Diabetes Pedigree Function value", min_value=0.0, format="%.2f")
-        Age = st.number_input("Age of the Person", min_value=0)
-        
-        if st.button("Diabetes Test Result"):
-            # Model prediction
-            try:
-                diab_prediction = diabetes_model.predict(
-                    [[Pregnancies, Glucose, BloodPressure, SkinThickness, Insulin, BMI, DiabetesPedigreeFunction, Age]]
-                )
-                result = "Positive" if diab_prediction[0] == 1 else "Negative"
-            except Exception as e:
-                st.error("Error during prediction. Check your model or input data.")
-                result = None
-            if result:
-                # Display test result message
-                st.markdown(f"### Test Result: {result}")
-                # Set session state for showing the report
-                st.session_state.show_report = True
-
-        if st.session_state.show_report:
-            show_report = st.button("Click here to see Test Report")
-            if show_report:
-                # Display detailed test data only after clicking the link
-                st.markdown("#### Patient Information:")
-                st.markdown(f"*Patient Name*: {patient_name}")
-                st.markdown(f"*Age*: {Age}")  # Patient Information
-
-                # Tabular Data
-                test_data = {
-                    "Parameter Name": [
-                        "Pregnancies", "Glucose", "Blood Pressure", "Skin Thickness", 
-                        "Insulin", "BMI", "Diabetes Pedigree Function"
-                    ],
-                    "Patient Values": [
-                        Pregnancies, Glucose, BloodPressure, SkinThickness, 
-                        Insulin, BMI, DiabetesPedigreeFunction
-                    ],
-                    "Normal Range": [
-                        "0-10", "70-125", "120/80", "8-25", "25-250", "18.5-24.9", "< 1"
-                    ],
-                    "Unit": [
-                        "Number", "mg/dL", "mmHg", "mm", "mIU/L", "kg/m^2", "No units"
-                    ]
-                }
-                st.table(test_data)
-
+        diabetes_prediction_page()
 
     elif selected == "Heart Disease Prediction":
-        st.title('Heart Disease Prediction using ML')
-    
-        col1, col2, col3 = st.columns(3)
-    
-        with col1:
-            age = st.number_input('Age')
-        
-        with col2:
-            sex = st.number_input('Sex')
-        
-        with col3:
-            cp = st.number_input('Chest Pain types')
-        
-        with col1:
-            trestbps = st.number_input('Resting Blood Pressure')
-        
-        with col2:
-            chol = st.number_input('Serum Cholestoral in mg/dl')
-        
-        with col3:
-            fbs = st.number_input('Fasting Blood Sugar > 120 mg/dl')
-        
-        with col1:
-            restecg = st.number_input('Resting Electrocardiographic results')
-        
-        with col2:
-            thalach = st.number_input('Maximum Heart Rate achieved')
-        
-        with col3:
-            exang = st.number_input('Exercise Induced Angina')
-        
-        with col1:
-            oldpeak = st.number_input('ST depression induced by exercise')
-        
-        with col2:
-            slope = st.number_input('Slope of the peak exercise ST segment')
-        
-        with col3:
-            ca = st.number_input('Major vessels colored by flourosopy')
-        
-        with col1:
-            thal = st.number_input('thal: 0 = normal; 1 = fixed defect; 2 = reversable defect')
-
-        with col2:
-             patient_name = st.text_input("Patient Name")
-        if st.button('Heart Disease Test Result'):
-            try:
-                # Prepare the input data
-                inputs = [age, sex, cp, trestbps, chol, fbs, restecg, thalach, exang, oldpeak, slope, ca, thal]
-        
-                # Ensure that no inputs are missing or invalid
-                if any(i is None or i == '' for i in inputs):
-                    st.error("Please ensure all fields are filled.")
-                else:
-                    # Perform the prediction using the heart disease model
-                    heart_prediction = heart_disease_model.predict([inputs])
-            
-                    # Interpret the result
-                    heart_result = "Positive" if heart_prediction[0] == 1 else "Negative"
-                    st.markdown(f"### Test Result: {heart_result}")
-            
-                    # Show detailed information in a report
-                    st.session_state.show_report = True
-            except Exception as e:
-                st.error(f"An error occurred during prediction: {e}")
-
-        # Show detailed report if button is clicked
-        if st.session_state.show_report:
-            show_report = st.button("Click here to see Test Report")
-            if show_report:
-                # Patient Information
-                st.markdown(f"#### Patient Information:")
-                st.markdown(f"**Patient Name**: {patient_name}")
-                st.markdown(f"**Age**: {age}")
-        
-                # Test Parameters and Values
-                st.markdown(f"#### Test Parameters and Values:")
-
-                # Defining parameter names, ranges, and units
-                test_data = {
-                    "Parameter Name": [
-                        "Age", "Sex", "Chest Pain Type", "Resting Blood Pressure", 
-                        "Cholestoral", "Fasting Blood Sugar", "Resting Electrocardiographic", 
-                        "Max Heart Rate", "Exercise Angina", "ST Depression", 
-                        "Peak ST Slope", "Major Vessels", "Thalassemia"
-                    ],
-                    "Patient Values": [
-                        age, 'Female' if sex == 0 else 'Male', cp, trestbps, chol, 
-                        'Yes' if fbs == 1 else 'No', restecg, thalach, 
-                        'Yes' if exang == 1 else 'No', oldpeak, slope, ca, thal
-                    ],
-                    "Normal Range": [
-                        "1-120", "0 = Female, 1 = Male", "0: Typical Angina, 1: Atypical Angina, 2: Non-Anginal Pain, 3: Asymptomatic",
-                        "50-200", "100-600", "Yes: >120 mg/dl, No: <=120 mg/dl", "0: Normal, 1: ST-T wave abnormality, 2: Left ventricular hypertrophy",
-                        "60-220", "0: No, 1: Yes", "0.0-6.0", "0: Upsloping, 1: Flat, 2: Downsloping", "0-3", "0: Normal, 1: Fixed defect, 2: Reversible defect"
-                    ],
-                    "Unit": [
-                        "Years", "Female/Male", "Type", "mm Hg", "mg/dl", "Yes/No", "Type", 
-                        "bpm (beats per minute)", "Yes/No", "ST Depression", "Type", "Count", "Type"
-                    ]
-                }
-        
-                # Display the table using st.table
-                st.table(test_data)
+        heart_disease_prediction_page()
 
     # Parkinson's Prediction Page
     elif selected == "Parkinson's Prediction":
-        st.title("Parkinson's Disease Prediction using ML")
-
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            patient_name = st.text_input("Patient Name")
-
-        with col2:
-            Age = st.number_input("Age of the Person", min_value=0)
-
-        with col3:
-            fo = st.text_input('MDVP:Fo(Hz)')
-
-        with col4:
-            fhi = st.text_input('MDVP:Fhi(Hz)')
-
-        with col5:
-            flo = st.text_input('MDVP:Flo(Hz)')
-
-        with col1:
-            Jitter_percent = st.text_input('MDVP:Jitter(%)')
-
-        with col2:
-            Jitter_Abs = st.text_input('MDVP:Jitter(Abs)')
-
-        with col3:
-            RAP = st.text_input('MDVP:RAP')
-
-        with col4:
-            PPQ = st.text_input('MDVP:PPQ')
-
-        with col5:
-            DDP = st.text_input('Jitter:DDP')
-
-        with col1:
-            Shimmer = st.text_input('MDVP:Shimmer')
-
-        with col2:
-            Shimmer_dB = st.text_input('MDVP:Shimmer(dB)')
-
-        with col3:
-            APQ3 = st.text_input('Shimmer:APQ3')
-
-        with col4:
-            APQ5 = st.text_input('Shimmer:APQ5')
-
-        with col5:
-            APQ = st.text_input('MDVP:APQ')
-
-        with col1:
-            DDA = st.text_input('Shimmer:DDA')
-
-        with col2:
-            NHR = st.text_input('NHR')
-
-        with col3:
-            HNR = st.text_input('HNR')
-
-        with col4:
-            RPDE = st.text_input('RPDE')
-
-        with col5:
-            DFA = st.text_input('DFA')
-
-        with col1:
-            spread1 = st.text_input('spread1')
-
-        with col2:
-            spread2 = st.text_input('spread2')
-
-        with col3:
-            D2 = st.text_input('D2')
-
-        with col4:
-            PPE = st.text_input('PPE')
-
-        # Define the button to trigger prediction
-        if st.button("Parkinson's Test Result"):
-            # Collect input values
-            user_input = [fo, fhi, flo, Jitter_percent, Jitter_Abs, RAP, PPQ, DDP, Shimmer, Shimmer_dB, APQ3, APQ5,
-                      APQ, DDA, NHR, HNR, RPDE, DFA, spread1, spread2, D2, PPE]
-
-            try:
-                # Ensure that all user inputs are valid (not empty or None)
-                if any(i is None or i == '' for i in user_input):
-                    st.error("Please ensure all fields are filled.")
-                else:
-                    # Make prediction using the model
-                    parkinsons_prediction = parkinsons_model.predict([user_input])
-
-                    # Diagnosis result
-                    parkinsons_diagnosis = "Positive" if parkinsons_prediction[0] == 1 else "Negative"
-                    st.markdown(f"### Test Result: {parkinsons_diagnosis}")
-
-                    # Set the session state to show the report
-                    st.session_state.show_report = True
-
-            except Exception as e:
-                st.error(f"Error during prediction: {e}")
-
-        # Show detailed report if button is clicked
-        if st.session_state.show_report:
-            show_report = st.button("Click here to see Test Report")
-            if show_report:
-                # Patient Information
-                st.markdown(f"#### Patient Information:")
-                st.markdown(f"**Patient Name**: {patient_name}")
-                st.markdown(f"**Age**: {Age}")
-
-                # Test Parameters and Values
-                st.markdown(f"#### Test Parameters and Values:")
-
-                # Defining parameter names, ranges, and units
-                test_data = {
-                    "Parameter Name": [
-                        "MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)", "MDVP:Jitter(%)", 
-                        "MDVP:Jitter(Abs)", "MDVP:RAP", "MDVP:PPQ", "Jitter:DDP", "MDVP:Shimmer", 
-                        "MDVP:Shimmer(dB)", "Shimmer:APQ3", "Shimmer:APQ5", "MDVP:APQ", "Shimmer:DDA", 
-                        "NHR", "HNR", "RPDE", "DFA", "spread1", "spread2", "D2", "PPE"
-                        ],
-                    "Patient Values": [fo, fhi, flo, Jitter_percent, Jitter_Abs, RAP, PPQ, DDP, Shimmer, Shimmer_dB, APQ3, APQ5,
-                      APQ, DDA, NHR, HNR, RPDE, DFA, spread1, spread2, D2, PPE],
-                    "Normal Range": [
-                        "50-150", "50-160", "50-150", "0-3", "0-2", "0-2", "0-2", "0-2", 
-                        "0-1", "0-0.5", "0.1-0.5", "0.1-0.5", "0-1", "0-1", "0.1-0.5", "0.1-0.5", 
-                        "0-0.5", "0-0.5", "0-1", "0-2", "0-2", "0-1"
-                        ],
-                    "Unit": [
-                        "Hz", "Hz", "Hz", "%", "Abs", "No unit", "No unit", "No unit", "No unit", 
-                        "dB", "No unit", "No unit", "No unit", "No unit", "No unit", "No unit", "No unit", 
-                        "No unit", "No unit", "No unit", "No unit", "No unit"
-                    ]
-                }
-
-                # Display the table using st.table
-                st.table(test_data)
-    
+        parkinsons_prediction_page()